@@ -6,25 +6,70 @@ Place this file in a plugins directory and use:
     smpmgr --plugin-path=./plugins --ble Tempo-BT tempo storage-info
     smpmgr --plugin-path=./plugins --ble Tempo-BT tempo led-on red
     smpmgr --plugin-path-./plugins --ble Tempo-BT tempo logger-start
+    smpmgr --plugin-path=./plugins --ble Tempo-BT tempo repl
+    smpmgr --plugin-path=./plugins --ble Tempo-BT tempo do led-on:red logger-start
+    smpmgr --plugin-path=./plugins --ble Tempo-BT tempo serve
 """
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import io
+import json
 import logging
+import math
+import os
+import re
+import shlex
+import socket
+import stat
+import struct
+import sys
+import tempfile
 from enum import IntEnum, unique
-from typing import cast, List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import cast, List, Any, Callable, Coroutine, Mapping, Optional, Sequence, Tuple
 
+import click
 import smp.error as smperr
 import smp.message as smpmsg
 import typer
-from rich import print
+from pydantic import BaseModel
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
+from smpclient import SMPClient
+from smpclient.transport.ble import SMPBLETransport
 from smpmgr.common import Options, connect_with_spinner, get_smpclient
+from typer.core import TyperGroup
 
-app = typer.Typer(name="tempo", help="Tempo-BT custom commands (Group 64)")
+
+class _TempoGroup(TyperGroup):
+    """Keeps the subcommand's command line for forwarding to `tempo serve`."""
+
+    def resolve_command(self, ctx: click.Context, args: List[str]) -> Any:
+        ctx.meta["tempo.args"] = list(args)
+        return super().resolve_command(ctx, args)
+
+
+app = typer.Typer(
+    name="tempo", help="Tempo-BT custom commands (Group 64)", cls=_TempoGroup, no_args_is_help=True
+)
 logger = logging.getLogger(__name__)
-console = Console()
+# Status lines are plain text; skip Rich's highlighter regexes and wrapping
+console = Console(highlight=False, soft_wrap=True)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# One event loop for the whole process, rather than one per asyncio.run(),
+# on uvloop where it is installed
+_runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+atexit.register(_runner.close)
 
 # Constants matching mcumgr_custom.c
 MGMT_GROUP_ID_TEMPO = 64
@@ -39,6 +84,34 @@ TEMPO_MGMT_ID_SESSION_DELETE = 5
 TEMPO_MGMT_ID_SETTINGS_GET = 6
 TEMPO_MGMT_ID_SETTINGS_SET = 7
 
+# Sessions requested per session-list round trip
+SESSION_LIST_PAGE_SIZE = 64
+# Longer session lists are printed as plain rows rather than a table
+SESSION_LIST_TABLE_MAX = 200
+
+_MB = 1 << 20
+
+# LED color presets, keyed by lowercase name
+_PRESETS: Mapping[str, Tuple[int, int, int]] = MappingProxyType({
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "cyan": (0, 255, 255),
+    "magenta": (255, 0, 255),
+    "white": (255, 255, 255),
+    "orange": (255, 128, 0),
+})
+_PRESET_NAMES = ", ".join(_PRESETS)
+
+# Log storage backends accepted by settings-set
+_LOG_BACKENDS = frozenset({"fatfs", "littlefs"})
+
+# BLE connection parameters, in 1.25 ms (interval) and 10 ms (timeout) units
+BLE_MIN_CONN_INTERVAL_UNITS = 6  # 7.5 ms, the shortest the spec allows
+BLE_MIN_SUPERVISION_TIMEOUT_UNITS = 200  # 2 s
+BLE_MAX_SUPERVISION_TIMEOUT_UNITS = 3200  # 32 s, the longest the spec allows
+
 
 @unique
 class TEMPO_RET_RC(IntEnum):
@@ -58,17 +131,29 @@ class TempoErrorV2(smperr.ErrorV2[TEMPO_RET_RC]):
 
 
 # Session List Command
+class SessionEntry(BaseModel):
+    """One entry of a session list response."""
+    is_dir: bool = False
+    name: str = "Unknown"
+    size: int = 0
+
+
 class SessionListRequest(smpmsg.ReadRequest):
     _GROUP_ID = MGMT_GROUP_ID_TEMPO
     _COMMAND_ID = TEMPO_MGMT_ID_SESSION_LIST
 
+    # Paging; firmware without paging support ignores these and returns
+    # every session, with count equal to the number returned
+    offset: Optional[int] = None
+    limit: Optional[int] = None
+
 
 class SessionListResponse(smpmsg.ReadResponse):
     _GROUP_ID = MGMT_GROUP_ID_TEMPO
     _COMMAND_ID = TEMPO_MGMT_ID_SESSION_LIST
     
-    sessions: List[Dict[str, Any]]
-    count: int
+    sessions: List[SessionEntry]
+    count: int  # total number of sessions, not just those in this page
 
 
 class SessionList(SessionListRequest):
@@ -222,398 +307,857 @@ class SessionDelete(SessionDeleteRequest):
     _ErrorV1 = TempoErrorV1
     _ErrorV2 = TempoErrorV2
 
-# CLI Commands
-@app.command(name="session-list")
-def session_list(ctx: typer.Context) -> None:
-    """List all logging sessions on the device."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(SessionList())
-        
-        if response.sessions:
-            table = Table(title=f"Tempo-BT Sessions ({response.count} found)")
-            table.add_column("Type", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Size", style="yellow")
-            
-            for session in response.sessions:
-                type_str = "DIR" if session.get("is_dir", False) else "FILE"
-                name = session.get("name", "Unknown")
-                size = session.get("size", 0)
-                size_str = f"{size:,} bytes"
-                table.add_row(type_str, name, size_str)
-            
-            console.print(table)
+async def _hcitool(*args: str) -> str:
+    """Run hcitool and return its output, raising RuntimeError if it fails.
+
+    BlueZ has no D-Bus API for changing the parameters of an existing
+    connection, so link tuning on Linux needs hcitool and the privileges to
+    open a raw HCI socket.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "hcitool", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    out, err = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(err.decode().strip() or f"hcitool {args[0]} exited with {proc.returncode}")
+    return out.decode()
+
+
+async def _hci_handle(address: str) -> int:
+    """Return the HCI handle of the LE connection to `address`."""
+    match = re.search(rf"LE {re.escape(address)} handle (\d+)", await _hcitool("con"), re.IGNORECASE)
+    if match is None:
+        raise RuntimeError(f"No LE connection handle found for {address}")
+    return int(match[1])
+
+
+async def _tune_link(
+    smpclient: SMPClient, conn_interval_ms: Optional[float], data_length: Optional[int]
+) -> None:
+    """Request a short connection interval and/or a longer link-layer data length.
+
+    Every SMP request waits at least one connection interval for its
+    response, so the peripheral's default (often 50-100 ms) dominates short
+    commands, and a response larger than the data length is split over
+    several link-layer packets. The ATT MTU needs no help here: BlueZ,
+    WinRT and CoreBluetooth all exchange it on connect.
+
+    The central can only ask; the device may clamp or refuse a request, so
+    any failure is logged and the connection is used as is.
+    """
+    transport = smpclient._transport
+    if not isinstance(transport, SMPBLETransport):
+        return
+
+    backend = transport._client._backend
+    try:
+        if SMPBLETransport._bluez_backend(backend):
+            handle = await _hci_handle(transport._client.address)
+            if conn_interval_ms is not None:
+                max_interval_units = max(BLE_MIN_CONN_INTERVAL_UNITS, round(conn_interval_ms / 1.25))
+                # The spec requires timeout > 2 x max interval at latency 0; allow 2.5x
+                timeout_units = min(
+                    BLE_MAX_SUPERVISION_TIMEOUT_UNITS,
+                    max(BLE_MIN_SUPERVISION_TIMEOUT_UNITS, math.ceil(max_interval_units * 1.25 * 2.5 / 10)),
+                )
+                await _hcitool(
+                    "lecup",
+                    "--handle", str(handle),
+                    "--min", str(BLE_MIN_CONN_INTERVAL_UNITS),
+                    "--max", str(max_interval_units),
+                    "--latency", "0",
+                    "--timeout", str(timeout_units),
+                )
+                logger.info(f"Requested a {conn_interval_ms} ms connection interval")
+            if data_length is not None:
+                # HCI LE Set Data Length: handle, TX octets, TX time on the 1M PHY
+                tx_time_us = (data_length + 14) * 8
+                params = struct.pack("<HHH", handle, data_length, tx_time_us)
+                await _hcitool("cmd", "0x08", "0x0022", *(f"0x{b:02x}" for b in params))
+                logger.info(f"Requested a {data_length} byte data length")
+        elif SMPBLETransport._winrt_backend(backend):
+            if conn_interval_ms is not None:
+                # Windows only offers presets; ThroughputOptimized is the shortest interval
+                from winrt.windows.devices.bluetooth import BluetoothLEPreferredConnectionParameters
+
+                backend._requester.request_preferred_connection_parameters(
+                    BluetoothLEPreferredConnectionParameters.throughput_optimized
+                )
+                logger.info("Requested the throughput optimized connection parameters")
+            if data_length is not None:
+                logger.info("Windows negotiates the data length itself; --data-length ignored")
         else:
-            console.print("No sessions found", style="yellow")
+            logger.info("Link parameter updates are not supported on this platform")
+    except Exception as e:
+        logger.warning(f"Could not update link parameters: {e}")
+
+
+class TempoSession:
+    """Connection state shared by every tempo command run in this process.
+
+    The SMP client is built on first use and connected at most once, so
+    several commands (see `repl`) can run over a single BLE link instead of
+    paying the connect cost for each one.
+    """
+
+    def __init__(
+        self,
+        options: Options,
+        conn_interval_ms: Optional[float] = None,
+        data_length: Optional[int] = None,
+    ) -> None:
+        self.options = options
+        self.conn_interval_ms = conn_interval_ms
+        self.data_length = data_length
+        self._smpclient: Optional[SMPClient] = None
+        self._connected = False
+
+    @property
+    def smpclient(self) -> SMPClient:
+        # Built lazily so `tempo <command> --help` works without a transport
+        if self._smpclient is None:
+            self._smpclient = get_smpclient(self.options)
+        return self._smpclient
+
+    def _link_lost(self) -> bool:
+        transport = self.smpclient._transport
+        return isinstance(transport, SMPBLETransport) and transport._disconnected_event.is_set()
+
+    async def connect(self) -> SMPClient:
+        """Connect to the device if not already connected and return the client.
+
+        Reconnects if the BLE link has dropped since the last command (out of
+        range, or the device rebooted).
+        """
+        if self._connected and self._link_lost():
+            logger.warning("Lost the connection to the device; reconnecting")
+            self._connected = False
+        if not self._connected:
+            await connect_with_spinner(self.smpclient, self.options.timeout)
+            self._connected = True
+            if self.conn_interval_ms is not None or self.data_length is not None:
+                await _tune_link(self.smpclient, self.conn_interval_ms, self.data_length)
+        return self.smpclient
+
+    def close(self) -> None:
+        """Disconnect from the device if connected."""
+        if self._connected:
+            self._connected = False
+            _runner.run(self.smpclient.disconnect())
+
+    def reset(self) -> None:
+        """Drop the connection after a failed request, so the next command reconnects."""
+        try:
+            self.close()
+        except Exception:
+            logger.debug("Disconnect after a failed request failed too", exc_info=True)
 
-    asyncio.run(f())
 
+def _async_command(fn: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., None]:
+    """Adapt an `async def` command to Typer by running it on `_runner`."""
+    @functools.wraps(fn)
+    def command(*args: Any, **kwargs: Any) -> None:
+        _runner.run(fn(*args, **kwargs))
 
-@app.command(name="storage-info")
-def storage_info(ctx: typer.Context) -> None:
-    """Get storage statistics from the device."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+    return command
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(StorageInfo())
-        
-        free_mb = response.free_bytes / (1024 * 1024)
-        total_mb = response.total_bytes / (1024 * 1024)
-        
-        table = Table(title="Tempo-BT Storage Info")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
-        
-        table.add_row("Backend", response.backend)
-        table.add_row("Total Space", f"{total_mb:.1f} MB ({response.total_bytes:,} bytes)")
-        table.add_row("Free Space", f"{free_mb:.1f} MB ({response.free_bytes:,} bytes)")
-        table.add_row("Used", f"{response.used_percent}%")
-        
-        console.print(table)
 
-    asyncio.run(f())
+def _daemon_socket_dir() -> str:
+    """Return this user's directory for `tempo serve` sockets.
 
+    $XDG_RUNTIME_DIR where set, else a per-user subdirectory of the temp
+    directory. Either way only this user can get at the sockets in it.
+    """
+    return os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"tempo-{os.getuid()}")
 
-@app.command(name="led-on")
-def led_on(
+
+def _daemon_socket_path(options: Options) -> str:
+    """Return the Unix socket path `tempo serve` listens on for this device.
+
+    TEMPO_DAEMON_SOCK overrides the default path in `_daemon_socket_dir()`.
+    """
+    if "TEMPO_DAEMON_SOCK" in os.environ:
+        return os.environ["TEMPO_DAEMON_SOCK"]
+    transport = options.transport
+    target = re.sub(r"[^\w.-]", "_", transport.ble or transport.port or transport.ip or "default")
+    return os.path.join(_daemon_socket_dir(), f"tempo-{target}.sock")
+
+
+def _is_own_socket(path: str) -> bool:
+    """Return whether `path` is a Unix socket owned by this user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+# Options naming a file that the client reads for the daemon, which has its
+# own working directory and no access to the client's stdin
+_CLIENT_FILE_OPTIONS = frozenset({"--batch-file"})
+
+
+def _read_client_files(args: Sequence[str]) -> Optional[Tuple[List[str], str]]:
+    """Read the files named by `_CLIENT_FILE_OPTIONS` in `args` on this side.
+
+    Returns `args` with each such option pointed at stdin ('-'), and the file
+    contents to send as the daemon's stdin. Returns None if a file cannot be
+    read; the command then runs locally and reports the error when parsing.
+    """
+    rewritten: List[str] = []
+    stdin = ""
+    remaining = iter(args)
+    for arg in remaining:
+        name, equals, value = arg.partition("=")
+        if name not in _CLIENT_FILE_OPTIONS:
+            rewritten.append(arg)
+            continue
+
+        path = value if equals else next(remaining, None)
+        if path is None:
+            return None
+        try:
+            if path == "-":
+                stdin = sys.stdin.read()
+            else:
+                with open(path) as f:
+                    stdin = f.read()
+        except OSError:
+            return None
+        rewritten += [name, "-"]
+    return rewritten, stdin
+
+
+def _forward(sock_path: str, args: Sequence[str]) -> Optional[int]:
+    """Run a command line in a listening `tempo serve` and return its exit code.
+
+    Returns None if no daemon is listening on `sock_path`, or if a file the
+    command names cannot be read here (see `_read_client_files`).
+    """
+    # Never send a command line (or --batch-file contents) to a socket another
+    # user could have put there
+    if not _is_own_socket(sock_path):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        # Stale or unusable (e.g. too long a path) means there is no daemon
+        # of ours to talk to
+        try:
+            sock.connect(sock_path)
+        except OSError:
+            return None
+
+        # Only read files (and stdin, for '-') once a daemon has answered;
+        # otherwise the command runs locally and needs them itself
+        client_files = _read_client_files(args)
+        if client_files is None:
+            return None
+        args, stdin = client_files
+
+        try:
+            # The daemon renders for this terminal, so output matches a direct run
+            request = {
+                "args": list(args),
+                "stdin": stdin,
+                "terminal": console.is_terminal,
+                "width": console.width,
+                "color_system": console.color_system,
+            }
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            reply = json.loads(sock.makefile("rb").readline())
+        except (OSError, json.JSONDecodeError):
+            console.print("Error: tempo serve closed the connection without replying", style="red")
+            return 1
+    sys.stdout.write(reply["output"])
+    return reply["exit_code"]
+
+
+async def _connect(ctx: typer.Context) -> SMPClient:
+    """Return the invocation's connected client, connecting on first use."""
+    return await cast(TempoSession, ctx.obj).connect()
+
+
+@app.callback()
+def tempo(
     ctx: typer.Context,
-    color: str = typer.Argument(..., help="Color name (red,green,blue,etc) or hex #RRGGBB"),
+    conn_interval_ms: Optional[float] = typer.Option(
+        None,
+        "--conn-interval-ms",
+        min=7.5,
+        max=4000.0,
+        help="Request this BLE connection interval after connecting (7.5-4000 ms)",
+    ),
+    data_length: Optional[int] = typer.Option(
+        None,
+        "--data-length",
+        min=27,
+        max=251,
+        help="Request this BLE link-layer data length after connecting (27-251 bytes, Linux only)",
+    ),
 ) -> None:
-    """Turn on the LED with specified color."""
+    """Tempo-BT custom commands (Group 64)"""
     options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+
+    # Hand single commands to a running 'tempo serve' for this device, which
+    # already holds the connection
+    if ctx.invoked_subcommand not in _LOCAL_COMMANDS and hasattr(socket, "AF_UNIX"):
+        exit_code = _forward(_daemon_socket_path(options), ctx.meta["tempo.args"])
+        if exit_code is not None:
+            raise typer.Exit(exit_code)
+
+    tempo_session = TempoSession(options, conn_interval_ms, data_length)
+    ctx.obj = tempo_session
+    ctx.call_on_close(tempo_session.close)
+
+
+# CLI Commands
+@app.command(name="session-list")
+@_async_command
+async def session_list(ctx: typer.Context) -> None:
+    """List all logging sessions on the device."""
+    smpclient = await _connect(ctx)
+    
+    response = await smpclient.request(SessionList(offset=0, limit=SESSION_LIST_PAGE_SIZE))
+    
+    if response.sessions:
+        if response.count > SESSION_LIST_TABLE_MAX:
+            # A Live table keeps every row and redraws all of them on each
+            # refresh, so long lists print plain rows and keep none
+            console.print(f"Tempo-BT Sessions ({response.count} found)")
+            add_row: Callable[..., None] = lambda *row: console.out("\t".join(row))
+            live: Any = contextlib.nullcontext()
+        else:
+            table = Table(title=f"Tempo-BT Sessions ({response.count} found)")
+            table.add_column("Type", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Size", style="yellow")
+            add_row = table.add_row
+            live = Live(table, console=console, refresh_per_second=10)
+        
+        # Show each page as it arrives rather than after the whole list
+        with live:
+            offset = 0
+            while True:
+                for session in response.sessions:
+                    add_row("DIR" if session.is_dir else "FILE", session.name, f"{session.size:,} bytes")
+
+                offset += len(response.sessions)
+                if not response.sessions or offset >= response.count:
+                    break
+                response = await smpclient.request(
+                    SessionList(offset=offset, limit=SESSION_LIST_PAGE_SIZE)
+                )
+        if isinstance(live, Live) and not console.is_terminal:
+            console.line()  # Live leaves its output unterminated off a terminal
+    else:
+        console.print("No sessions found", style="yellow")
+
+
+@app.command(name="storage-info")
+@_async_command
+async def storage_info(ctx: typer.Context) -> None:
+    """Get storage statistics from the device."""
+    smpclient = await _connect(ctx)
+    
+    response = await smpclient.request(StorageInfo())
+
+    # Scripts polling free space get one key=value line instead of a table
+    if not console.is_terminal:
+        console.out(
+            f"backend={response.backend} total={response.total_bytes} "
+            f"free={response.free_bytes} used={response.used_percent}%"
+        )
+        return
+    
+    free_mb = response.free_bytes / _MB
+    total_mb = response.total_bytes / _MB
     
-    # Color presets
-    presets = {
-        "red": (255, 0, 0),
-        "green": (0, 255, 0),
-        "blue": (0, 0, 255),
-        "yellow": (255, 255, 0),
-        "cyan": (0, 255, 255),
-        "magenta": (255, 0, 255),
-        "white": (255, 255, 255),
-        "orange": (255, 128, 0),
-    }
+    table = Table(title="Tempo-BT Storage Info")
+    table.add_column("Property", style="cyan")
+    table.add_column("Value", style="green")
     
-    # Parse color
+    table.add_row("Backend", response.backend)
+    table.add_row("Total Space", f"{total_mb:.1f} MB ({response.total_bytes:,} bytes)")
+    table.add_row("Free Space", f"{free_mb:.1f} MB ({response.free_bytes:,} bytes)")
+    table.add_row("Used", f"{response.used_percent}%")
+    
+    console.print(table)
+
+
+def _parse_color(color: str) -> Tuple[int, int, int]:
+    """Return the RGB value of a preset name or #RRGGBB, or raise typer.BadParameter."""
     if color.startswith("#"):
         hex_color = color.lstrip("#")
         if len(hex_color) != 6:
-            console.print("Error: Hex color must be #RRGGBB format", style="red")
-            raise typer.Exit(1)
+            raise typer.BadParameter("Hex color must be #RRGGBB format")
         try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
+            # Unlike int(..., 16), fromhex rejects '_', '+' and '-'
+            r, g, b = bytes.fromhex(hex_color)
         except ValueError:
-            console.print("Error: Invalid hex color", style="red")
-            raise typer.Exit(1)
-    elif color.lower() in presets:
-        r, g, b = presets[color.lower()]
-    else:
-        console.print(f"Error: Unknown color '{color}'", style="red")
-        console.print(f"Available colors: {', '.join(presets.keys())}")
-        raise typer.Exit(1)
+            raise typer.BadParameter("Invalid hex color")
+        return r, g, b
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LEDControl(
-            enable=True,
-            r=r,
-            g=g,
-            b=b
-        ))
-        
-        console.print(f"LED set to {color} (RGB {r},{g},{b})", style="green")
-
-    asyncio.run(f())
+    rgb = _PRESETS.get(color.lower())
+    if rgb is None:
+        raise typer.BadParameter(f"Unknown color '{color}'. Available colors: {_PRESET_NAMES}")
+    return rgb
 
 
-@app.command(name="led-off")
-def led_off(ctx: typer.Context) -> None:
-    """Turn off LED override (return to app control)."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
-
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LEDControl(
-            enable=False,
-            r=0,
-            g=0,
-            b=0
-        ))
-        
-        console.print("LED override disabled - returned to app control", style="green")
+def _check_color(color: str) -> str:
+    _parse_color(color)
+    return color
 
-    asyncio.run(f())
 
+@app.command(name="led-on")
+@_async_command
+async def led_on(
+    ctx: typer.Context,
+    # Checked while parsing, so 'do' rejects a bad color before running anything
+    color: str = typer.Argument(
+        ..., callback=_check_color, help=f"Color name ({_PRESET_NAMES}) or hex #RRGGBB"
+    ),
+) -> None:
+    """Turn on the LED with specified color."""
+    r, g, b = _parse_color(color)
 
-@app.command(name="logger-start")
-def logger_start(ctx: typer.Context) -> None:
-    """Start logging (will auto-arm if needed)."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+    smpclient = await _connect(ctx)
+    
+    response = await smpclient.request(LEDControl(
+        enable=True,
+        r=r,
+        g=g,
+        b=b
+    ))
+    
+    console.print(f"LED set to {color} (RGB {r},{g},{b})", style="green")
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LoggerControl(action="start"))
-        
-        if response.success:
-            console.print(f"Logger started successfully. State: {response.state}", style="green")
-            
-            if response.session_id is not None:
-                console.print(f"Session ID: {response.session_id}")
-                console.print(f"Session Path: {response.session_path}")
-        else:
-            console.print(f"Failed to start logger. State: {response.state}", style="red")
 
-    asyncio.run(f())
+@app.command(name="led-off")
+@_async_command
+async def led_off(ctx: typer.Context) -> None:
+    """Turn off LED override (return to app control)."""
+    smpclient = await _connect(ctx)
+    
+    response = await smpclient.request(LEDControl(
+        enable=False,
+        r=0,
+        g=0,
+        b=0
+    ))
+    
+    console.print("LED override disabled - returned to app control", style="green")
 
 
-@app.command(name="logger-stop")
-def logger_stop(ctx: typer.Context) -> None:
-    """Stop logging."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+# Logger actions: past tense for messages, and help for the logger-<action> command
+_LOGGER_ACTIONS = {
+    "start": ("started", "Start logging (will auto-arm if needed)."),
+    "stop": ("stopped", "Stop logging."),
+    "arm": ("armed", "Arm the logger."),
+    "disarm": ("disarmed", "Disarm the logger."),
+}
+_LOGGER_ACTION_NAMES = ", ".join(_LOGGER_ACTIONS)
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LoggerControl(action="stop"))
-        
-        if response.success:
-            console.print(f"Logger stopped successfully. State: {response.state}", style="green")
-        else:
-            console.print(f"Failed to stop logger. State: {response.state}", style="red")
 
-    asyncio.run(f())
+async def _logger_action(ctx: typer.Context, action: str) -> None:
+    smpclient = await _connect(ctx)
 
+    response = await smpclient.request(LoggerControl(action=action))
 
-@app.command(name="logger-arm")
-def logger_arm(ctx: typer.Context) -> None:
-    """Arm the logger."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+    if response.success:
+        done = _LOGGER_ACTIONS[action][0]
+        console.print(f"Logger {done} successfully. State: {response.state}", style="green")
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LoggerControl(action="arm"))
-        
-        if response.success:
-            console.print(f"Logger armed successfully. State: {response.state}", style="green")
-        else:
-            console.print(f"Failed to arm logger. State: {response.state}", style="red")
+        if action == "start" and response.session_id is not None:
+            console.print(f"Session ID: {response.session_id}")
+            console.print(f"Session Path: {response.session_path}")
+    else:
+        console.print(f"Failed to {action} logger. State: {response.state}", style="red")
+        raise typer.Exit(1)
 
-    asyncio.run(f())
 
+def _logger_command(action: str) -> Callable[[typer.Context], None]:
+    async def command(ctx: typer.Context) -> None:
+        await _logger_action(ctx, action)
 
-@app.command(name="logger-disarm")
-def logger_disarm(ctx: typer.Context) -> None:
-    """Disarm the logger."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+    command.__doc__ = _LOGGER_ACTIONS[action][1]
+    return _async_command(command)
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LoggerControl(action="disarm"))
-        
-        if response.success:
-            console.print(f"Logger disarmed successfully. State: {response.state}", style="green")
-        else:
-            console.print(f"Failed to disarm logger. State: {response.state}", style="red")
 
-    asyncio.run(f())
+for _action in _LOGGER_ACTIONS:
+    app.command(name=f"logger-{_action}")(_logger_command(_action))
 
 
 @app.command(name="logger-control")
-def logger_control(
+@_async_command
+async def logger_control(
     ctx: typer.Context,
-    action: str = typer.Argument(..., help="Action: start, stop, arm, or disarm"),
+    action: str = typer.Argument(
+        ..., click_type=click.Choice(list(_LOGGER_ACTIONS)), help=f"Action: {_LOGGER_ACTION_NAMES}"
+    ),
 ) -> None:
     """Generic logger control command."""
-    valid_actions = ["start", "stop", "arm", "disarm"]
-    
-    if action not in valid_actions:
-        console.print(f"Error: Invalid action '{action}'", style="red")
-        console.print(f"Valid actions: {', '.join(valid_actions)}")
-        raise typer.Exit(1)
-    
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+    await _logger_action(ctx, action)
+
+_DELETE_PROMPT = "Are you sure you want to delete session '{}'?"
+_BATCH_DELETE_PROMPT = "Are you sure you want to delete {} sessions?"
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(LoggerControl(action=action))
-        
-        if response.success:
-            console.print(f"Logger action '{action}' successful. State: {response.state}", style="green")
-            
-            if action == "start" and response.session_id is not None:
-                console.print(f"Session ID: {response.session_id}")
-                console.print(f"Session Path: {response.session_path}")
-        else:
-            console.print(f"Logger action '{action}' failed. State: {response.state}", style="red")
 
-    asyncio.run(f())
+async def _delete_session(smpclient: SMPClient, session: str) -> bool:
+    response = await smpclient.request(SessionDelete(session=session))
+
+    if response.success:
+        console.print(f"Session '{session}' deleted successfully", style="green")
+        if response.files_deleted is not None:
+            console.print(f"Files deleted: {response.files_deleted}")
+    else:
+        console.print(f"Failed to delete session '{session}'", style="red")
+        if response.error:
+            console.print(f"Error: {response.error}", style="red")
+    return response.success
+
 
 @app.command(name="session-delete")
-def session_delete(
+@_async_command
+async def session_delete(
     ctx: typer.Context,
-    session: str = typer.Argument(..., help="Session name (e.g., '20250117/7BF3655C')"),
+    session: Optional[str] = typer.Argument(None, help="Session name (e.g., '20250117/7BF3655C')"),
+    batch_file: Optional[typer.FileText] = typer.Option(
+        None, "--batch-file", help="Delete the sessions listed in this file, one per line ('-' for stdin)"
+    ),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
 ) -> None:
     """Delete a logging session and all its files."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
-    
+    if (session is None) == (batch_file is None):
+        console.print("Error: Give either a session name or --batch-file", style="red")
+        raise typer.Exit(1)
+
+    if batch_file is None:
+        sessions = [session]
+        prompt = _DELETE_PROMPT.format(session)
+    else:
+        lines = (line.strip() for line in batch_file)
+        sessions = [line for line in lines if line and not line.startswith("#")]
+        prompt = _BATCH_DELETE_PROMPT.format(len(sessions))
+        if not sessions:
+            console.print("No sessions to delete", style="yellow")
+            raise typer.Exit()
+
     # Confirm deletion unless --yes flag is provided
     if not yes:
-        confirm = typer.confirm(f"Are you sure you want to delete session '{session}'?")
+        confirm = typer.confirm(prompt)
         if not confirm:
             console.print("Deletion cancelled", style="yellow")
             raise typer.Exit()
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(SessionDelete(session=session))
-        
-        if response.success:
-            console.print(f"Session '{session}' deleted successfully", style="green")
-            if response.files_deleted is not None:
-                console.print(f"Files deleted: {response.files_deleted}")
-        else:
-            console.print(f"Failed to delete session '{session}'", style="red")
-            if response.error:
-                console.print(f"Error: {response.error}", style="red")
+    smpclient = await _connect(ctx)
+
+    # One at a time: the BLE transport cannot interleave requests
+    failed = 0
+    for name in sessions:
+        if not await _delete_session(smpclient, name):
+            failed += 1
 
-    asyncio.run(f())
+    if failed:
+        raise typer.Exit(1)
 
 # Add CLI commands for settings
 @app.command(name="settings-get")
-def settings_get(ctx: typer.Context) -> None:
+@_async_command
+async def settings_get(ctx: typer.Context) -> None:
     """Get all device settings from non-volatile memory."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
+    smpclient = await _connect(ctx)
+    
+    response = await smpclient.request(SettingsGet())
+    
+    table = Table(title="Tempo-BT Device Settings")
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="green")
+    table.add_column("Description", style="yellow")
+    
+    table.add_row("BLE Name", response.ble_name, "Bluetooth advertising name")
+    table.add_row("PPS Enabled", str(response.pps_enabled), "GPS pulse-per-second input")
+    table.add_row("PCB Variant", f"0x{response.pcb_variant:02X}", "Hardware variant identifier")
+    table.add_row("Log Backend", response.log_backend, "Storage backend (sdcard/littlefs)")
+    
+    console.print(table)
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        response = await smpclient.request(SettingsGet())
-        
-        table = Table(title="Tempo-BT Device Settings")
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="green")
-        table.add_column("Description", style="yellow")
-        
-        table.add_row("BLE Name", response.ble_name, "Bluetooth advertising name")
-        table.add_row("PPS Enabled", str(response.pps_enabled), "GPS pulse-per-second input")
-        table.add_row("PCB Variant", f"0x{response.pcb_variant:02X}", "Hardware variant identifier")
-        table.add_row("Log Backend", response.log_backend, "Storage backend (sdcard/littlefs)")
-        
-        console.print(table)
 
-    asyncio.run(f())
+def _check_ble_name(ble_name: Optional[str]) -> Optional[str]:
+    if ble_name is not None and len(ble_name) > 31:
+        raise typer.BadParameter(f"BLE name too long (max 31 chars, got {len(ble_name)})")
+    return ble_name
+
 
 @app.command(name="settings-set")
-def settings_set(
+@_async_command
+async def settings_set(
     ctx: typer.Context,
-    ble_name: Optional[str] = typer.Option(None, "--ble-name", help="Set Bluetooth advertising name (max 31 chars)"),
+    ble_name: Optional[str] = typer.Option(None, "--ble-name", callback=_check_ble_name, help="Set Bluetooth advertising name (max 31 chars)"),
     pps_enabled: Optional[bool] = typer.Option(None, "--pps-enabled/--no-pps-enabled", help="Enable/disable GPS PPS input"),
-    pcb_variant: Optional[int] = typer.Option(None, "--pcb-variant", help="Set PCB hardware variant (0-255)"),
-    log_backend: Optional[str] = typer.Option(None, "--log-backend", help="Set log storage backend (sdcard/internal)"),
+    pcb_variant: Optional[int] = typer.Option(None, "--pcb-variant", min=0, max=255, help="Set PCB hardware variant (0-255)"),
+    log_backend: Optional[str] = typer.Option(None, "--log-backend", click_type=click.Choice(sorted(_LOG_BACKENDS)), help="Set log storage backend (fatfs/littlefs)"),
 ) -> None:
     """Set one or more device settings in non-volatile memory."""
-    options = cast(Options, ctx.obj)
-    smpclient = get_smpclient(options)
-    
     # Check if any settings were provided
     if all(opt is None for opt in [ble_name, pps_enabled, pcb_variant, log_backend]):
         console.print("Error: No settings provided. Use --help to see available options.", style="red")
         raise typer.Exit(1)
-    
-    # Validate inputs
-    if ble_name is not None and len(ble_name) > 31:
-        console.print(f"Error: BLE name too long (max 31 chars, got {len(ble_name)})", style="red")
-        raise typer.Exit(1)
-    
-    if pcb_variant is not None and not 0 <= pcb_variant <= 255:
-        console.print(f"Error: PCB variant must be 0-255 (got {pcb_variant})", style="red")
-        raise typer.Exit(1)
-    
-    if log_backend is not None and log_backend not in ["fatfs", "littlefs"]:
-        console.print(f"Error: Invalid log backend '{log_backend}' (must be 'fatfs' or 'littlefs')", style="red")
-        raise typer.Exit(1)
 
-    async def f() -> None:
-        await connect_with_spinner(smpclient, options.timeout)
-        
-        # Build request with only the fields that were specified
-        # SettingsSet is a frozen Pydantic model, so all fields must be
-        # provided at construction time.
-        kwargs = {}
-        settings_to_change = []
+    smpclient = await _connect(ctx)
+    
+    # Build request with only the fields that were specified
+    # SettingsSet is a frozen Pydantic model, so all fields must be
+    # provided at construction time.
+    kwargs = {}
+    settings_to_change = []
 
-        if ble_name is not None:
-            kwargs["ble_name"] = ble_name
-            settings_to_change.append(f"BLE Name = '{ble_name}'")
+    if ble_name is not None:
+        kwargs["ble_name"] = ble_name
+        settings_to_change.append(f"BLE Name = '{ble_name}'")
 
-        if pps_enabled is not None:
-            kwargs["pps_enabled"] = pps_enabled
-            settings_to_change.append(f"PPS Enabled = {pps_enabled}")
+    if pps_enabled is not None:
+        kwargs["pps_enabled"] = pps_enabled
+        settings_to_change.append(f"PPS Enabled = {pps_enabled}")
 
-        if pcb_variant is not None:
-            kwargs["pcb_variant"] = pcb_variant
-            settings_to_change.append(f"PCB Variant = 0x{pcb_variant:02X}")
+    if pcb_variant is not None:
+        kwargs["pcb_variant"] = pcb_variant
+        settings_to_change.append(f"PCB Variant = 0x{pcb_variant:02X}")
 
-        if log_backend is not None:
-            kwargs["log_backend"] = log_backend
-            settings_to_change.append(f"Log Backend = '{log_backend}'")
+    if log_backend is not None:
+        kwargs["log_backend"] = log_backend
+        settings_to_change.append(f"Log Backend = '{log_backend}'")
 
-        request = SettingsSet(**kwargs)
+    request = SettingsSet(**kwargs)
+    
+    console.print("Setting:", style="cyan")
+    for setting in settings_to_change:
+        console.print(f"  • {setting}", style="yellow")
+    
+    response = await smpclient.request(request)
+    
+    if response.success:
+        console.print("\nSettings updated successfully!", style="green")
         
-        console.print("Setting:", style="cyan")
-        for setting in settings_to_change:
-            console.print(f"  • {setting}", style="yellow")
+        # Show current values
+        table = Table(title="Current Settings")
+        table.add_column("Setting", style="cyan")
+        table.add_column("Value", style="green")
         
-        response = await smpclient.request(request)
+        table.add_row("BLE Name", response.ble_name)
+        table.add_row("PPS Enabled", str(response.pps_enabled))
+        table.add_row("PCB Variant", f"0x{response.pcb_variant:02X}")
+        table.add_row("Log Backend", response.log_backend)
         
-        if response.success:
-            console.print("\nSettings updated successfully!", style="green")
-            
-            # Show current values
-            table = Table(title="Current Settings")
-            table.add_column("Setting", style="cyan")
-            table.add_column("Value", style="green")
-            
-            table.add_row("BLE Name", response.ble_name)
-            table.add_row("PPS Enabled", str(response.pps_enabled))
-            table.add_row("PCB Variant", f"0x{response.pcb_variant:02X}")
-            table.add_row("Log Backend", response.log_backend)
-            
-            console.print(table)
-            
-            if response.note:
-                console.print(f"\nNote: {response.note}", style="yellow")
-        else:
-            console.print("Failed to update settings", style="red")
+        console.print(table)
+        
+        if response.note:
+            console.print(f"\nNote: {response.note}", style="yellow")
+    else:
+        console.print("Failed to update settings", style="red")
+
+
+# Commands that run other commands themselves; never nested or forwarded
+_LOCAL_COMMANDS = frozenset({"repl", "do", "serve", "daemon"})
+
+
+def _describe(e: Exception) -> str:
+    """Return an error message for `e`, falling back to its type (e.g. TimeoutError)."""
+    return str(e) or type(e).__name__
 
-    asyncio.run(f())
+
+def _invoke(group_ctx: click.Context, args: List[str], check_only: bool = False) -> int:
+    """Run a tempo command line in the shared session and return its exit code.
+
+    With `check_only`, the command line is parsed but not run.
+    """
+    group = cast(click.Group, group_ctx.command)
+    command = group.get_command(group_ctx, args[0])
+    if command is None or args[0] in _LOCAL_COMMANDS:
+        console.print(f"Error: Unknown command '{args[0]}'", style="red")
+        return 2
+
+    try:
+        with command.make_context(args[0], args[1:], parent=group_ctx) as sub_ctx:
+            if not check_only:
+                command.invoke(sub_ctx)
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        console.print("Aborted", style="yellow")
+        return 1
+    return 0
+
+
+@app.command(name="repl")
+def repl(ctx: typer.Context) -> None:
+    """Run tempo commands interactively over a single connection."""
+    group_ctx = cast(click.Context, ctx.parent)
+
+    console.print("Enter tempo commands (e.g. 'led-on red'); 'exit' or Ctrl-D to quit.")
+    while True:
+        try:
+            line = console.input("tempo> ")
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"Error: {e}", style="red")
+            continue
+
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+
+        # A failed request (e.g. a BLE timeout) ends that command, not the REPL
+        try:
+            _invoke(group_ctx, args)
+        except Exception as e:
+            logger.debug("tempo command failed", exc_info=True)
+            console.print(f"Error: {_describe(e)}", style="red")
+
+
+@app.command(name="do")
+def do(
+    ctx: typer.Context,
+    actions: List[str] = typer.Argument(
+        ..., help="Commands to run, with arguments joined by ':' (e.g. led-on:red logger-arm)"
+    ),
+) -> None:
+    """Run several commands in order over a single connection.
+
+    A BLE connect takes seconds, so 'do led-on:red logger-arm logger-start'
+    pays it once instead of three times. Stops at the first command that fails.
+    """
+    group_ctx = cast(click.Context, ctx.parent)
+    batch = [action.split(":") for action in actions]
+
+    # Parse the whole batch before the first command connects, so a typo or a
+    # bad value (unknown color or action, out-of-range option) in a later
+    # command fails before the earlier ones have changed the device. Checks
+    # that combine several options, like settings-set with none given, still
+    # happen when that command runs.
+    for args in batch:
+        exit_code = _invoke(group_ctx, args, check_only=True)
+        if exit_code:
+            raise typer.Exit(exit_code)
+
+    for args in batch:
+        exit_code = _invoke(group_ctx, args)
+        if exit_code:
+            raise typer.Exit(exit_code)
+
+
+def _serve_request(group_ctx: click.Context, request: bytes) -> dict:
+    """Run one forwarded command line and return its exit code and output."""
+    global console
+
+    try:
+        message = json.loads(request)
+        args = message["args"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return {"exit_code": 2, "output": "Error: Malformed request\n"}
+
+    # Capture everything the command prints, rendered as the client's own
+    # console would. Stdin holds only what the client sent (usually nothing),
+    # so a confirmation prompt aborts instead of waiting on the daemon's terminal
+    output = io.StringIO()
+    daemon_console, console = console, Console(
+        file=output,
+        force_terminal=bool(message.get("terminal")),
+        width=message.get("width"),
+        color_system=message.get("color_system"),
+        highlight=False,
+        soft_wrap=True,
+    )
+    stdin, sys.stdin = sys.stdin, io.StringIO(message.get("stdin", ""))
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            # A failed request (e.g. a BLE timeout) is reported to the client;
+            # the daemon keeps serving and reconnects for the next command
+            try:
+                exit_code = _invoke(group_ctx, args) if args else 2
+            except Exception as e:
+                logger.debug("Forwarded tempo command failed", exc_info=True)
+                console.print(f"Error: {_describe(e)}", style="red")
+                exit_code = 1
+                cast(TempoSession, group_ctx.obj).reset()
+    finally:
+        sys.stdin = stdin
+        console = daemon_console
+    return {"exit_code": exit_code, "output": output.getvalue()}
+
+
+@app.command(name="daemon", hidden=True)
+@app.command(name="serve")
+def serve(ctx: typer.Context) -> None:
+    """Hold the connection open and run commands forwarded from other invocations.
+
+    While it runs, 'tempo <command>' for the same device is sent to it over a
+    Unix socket and skips the BLE connect. Commands run one at a time.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("Error: serve needs Unix domain sockets, which this platform lacks", style="red")
+        raise typer.Exit(1)
+
+    tempo_session = cast(TempoSession, ctx.obj)
+    group_ctx = cast(click.Context, ctx.parent)
+    sock_path = _daemon_socket_path(tempo_session.options)
+
+    if "TEMPO_DAEMON_SOCK" not in os.environ:
+        sock_dir = _daemon_socket_dir()
+        with contextlib.suppress(FileExistsError):
+            os.mkdir(sock_dir, 0o700)
+        st = os.lstat(sock_dir)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            console.print(f"Error: {sock_dir} must be a directory only you can access", style="red")
+            raise typer.Exit(1)
+
+    if os.path.lexists(sock_path):
+        # Only ever replace our own socket, and only one nobody answers on
+        # (left over from a daemon that died)
+        if not _is_own_socket(sock_path):
+            console.print(f"Error: {sock_path} exists and is not your tempo serve socket", style="red")
+            raise typer.Exit(1)
+        if _forward(sock_path, []) is not None:
+            console.print(f"Error: tempo serve is already running on {sock_path}", style="red")
+            raise typer.Exit(1)
+        os.unlink(sock_path)
+
+    _runner.run(tempo_session.connect())
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # Owner-only from the moment it exists, even under TEMPO_DAEMON_SOCK
+        umask = os.umask(0o177)
+        try:
+            server.bind(sock_path)
+        finally:
+            os.umask(umask)
+        server.listen()
+        console.print(f"Serving on {sock_path}; Ctrl-C to stop")
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        request = conn.makefile("rb").readline()
+                        if not request:
+                            continue  # the client went away without asking anything
+                        reply = _serve_request(group_ctx, request)
+                        conn.sendall(json.dumps(reply).encode() + b"\n")
+                    except OSError as e:
+                        logger.warning(f"Lost a tempo serve client: {e}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(sock_path)
 
 # Plugin export - this is what smpmgr looks for
 plugin = app
\ No newline at end of file